@@ -2,24 +2,37 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required("Title"): str,
-        vol.Required("key"): str,
-    }
-)
+
+def _user_data_schema(name: str | None, address: str | None) -> vol.Schema:
+    """Return the user step schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required("name", default=name): str,
+            vol.Required("address", default=address): str,
+            vol.Required("key"): str,
+        }
+    )
+
+
+STEP_USER_DATA_SCHEMA = _user_data_schema(None, None)
+
+
+class _DiscoveryInfo(NamedTuple):
+    """Name and address of a discovered device."""
+
+    name: str
+    address: str
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
@@ -27,15 +40,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
 
     VERSION = 1
 
+    _discovery_info: _DiscoveryInfo | None = None
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> FlowResult:
         """Handle a flow initialized by bluetooth discovery."""
         _LOGGER.debug(discovery_info)
-        self.context["discovery_info"] = {
-            "name": discovery_info.name,
-            "address": discovery_info.address,
-        }
+        self._discovery_info = _DiscoveryInfo(
+            discovery_info.name, discovery_info.address
+        )
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
         return await self.async_step_user()
@@ -45,24 +59,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
     ) -> FlowResult:
         """User setup."""
         if user_input is None:
-            name = None
-            address = None
-
-            discovery_info = self.context.get("discovery_info")
-            if discovery_info:
-                name = self.context["discovery_info"]["name"]
-                address = self.context["discovery_info"]["address"]
-
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required("name", default=name): str,
-                        vol.Required("address", default=address): str,
-                        vol.Required("key"): str,
-                    }
-                ),
-            )
+            data_schema = STEP_USER_DATA_SCHEMA
+            if self._discovery_info:
+                data_schema = _user_data_schema(*self._discovery_info)
+
+            return self.async_show_form(step_id="user", data_schema=data_schema)
 
         await self.async_set_unique_id(user_input["address"])
         self._abort_if_unique_id_configured()
@@ -72,11 +73,3 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
         unique_id = user_input["unique_id"]
         await self.async_set_unique_id(unique_id)
         self.async_abort(reason="discovery_error")
-
-
-class CannotConnect(HomeAssistantError):
-    """Error to indicate we cannot connect."""
-
-
-class InvalidAuth(HomeAssistantError):
-    """Error to indicate there is invalid auth."""
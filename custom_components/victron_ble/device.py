@@ -1,12 +1,16 @@
+from __future__ import annotations
+
 import logging
+from enum import Enum
+from functools import lru_cache
+from typing import Callable
 
 from bluetooth_sensor_state_data import BluetoothData
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.helpers.service_info.bluetooth import BluetoothServiceInfo
 from sensor_state_data import SensorLibrary
-from sensor_state_data.enum import StrEnum
 from sensor_state_data.units import Units
-from victron_ble.devices import detect_device_type
+from victron_ble.devices import Device, DeviceData, detect_device_type
 from victron_ble.devices.battery_monitor import AuxMode, BatteryMonitorData
 from victron_ble.devices.battery_sense import BatterySenseData
 from victron_ble.devices.dc_energy_meter import DcEnergyMeterData
@@ -15,8 +19,31 @@ from victron_ble.devices.solar_charger import SolarChargerData
 
 _LOGGER = logging.getLogger(__name__)
 
+_VICTRON_MANUFACTURER_ID = 0x02E1
+# First byte of the manufacturer data of Victron Instant Readout advertisements
+_INSTANT_READOUT_PREFIX = 0x10
+# Prefix, model ID and readout type; all detect_device_type looks at
+_HEADER_LENGTH = 5
+
+# Resolved once so the per-advertisement handlers skip the attribute lookups
+_UNIT_AMPERE = Units.ELECTRIC_CURRENT_AMPERE
+_UNIT_MINUTES = Units.TIME_MINUTES
+_UNIT_VOLT = Units.ELECTRIC_POTENTIAL_VOLT
+_UNIT_WATT_HOUR = Units.ENERGY_WATT_HOUR
+_CLASS_CURRENT = SensorDeviceClass.CURRENT
+_CLASS_DURATION = SensorDeviceClass.DURATION
+_CLASS_ENUM = SensorDeviceClass.ENUM
+_CLASS_VOLTAGE = SensorDeviceClass.VOLTAGE
+_SENSOR_BATTERY = SensorLibrary.BATTERY__PERCENTAGE
+_SENSOR_CURRENT = SensorLibrary.CURRENT__ELECTRIC_CURRENT_AMPERE
+_SENSOR_POWER = SensorLibrary.POWER__POWER_WATT
+_SENSOR_TEMPERATURE = SensorLibrary.TEMPERATURE__CELSIUS
+_SENSOR_VOLTAGE = SensorLibrary.VOLTAGE__ELECTRIC_POTENTIAL_VOLT
+
+
+class VictronSensor:
+    """Keys of the sensors not covered by the sensor_state_data library."""
 
-class VictronSensor(StrEnum):
     AUX_MODE = "aux_mode"
     OPERATION_MODE = "operation_mode"
     EXTERNAL_DEVICE_LOAD = "external_device_load"
@@ -30,6 +57,19 @@ class VictronSensor(StrEnum):
     TIME_REMAINING = "time_remaining"
 
 
+@lru_cache(maxsize=256)
+def _enum_name_lower(member: Enum | None) -> str | None:
+    """Return the lower-cased name of an enum member, used as sensor state."""
+    # The library reports unknown charge states and errors as None
+    return member.name.lower() if member is not None else None
+
+
+@lru_cache(maxsize=64)
+def _detect_device_type(header: bytes) -> type[Device] | None:
+    """Return the parser class for an advertisement header."""
+    return detect_device_type(header)
+
+
 class VictronBluetoothDeviceData(BluetoothData):
     """Data for Victron BLE sensors."""
 
@@ -37,165 +77,179 @@ class VictronBluetoothDeviceData(BluetoothData):
         """Initialize the class."""
         super().__init__()
         self.key = key
+        self._parsers: dict[type[Device], Device] = {}
+        self._last_payload: bytes | None = None
+        self._device_initialized = False
+        self._device_name: str | None = None
+        self._device_type: str | None = None
+        self._last_aux_mode: AuxMode | None = None
 
     def _start_update(self, service_info: BluetoothServiceInfo) -> None:
         """Update from BLE advertisement data."""
-        _LOGGER.debug(
-            "Parsing Victron BLE advertisement data: %s", service_info.manufacturer_data
-        )
-        manufacturer_data = service_info.manufacturer_data
-        service_uuids = service_info.service_uuids
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Parsing Victron BLE advertisement data: %s",
+                service_info.manufacturer_data,
+            )
+        mfr_data = service_info.manufacturer_data.get(_VICTRON_MANUFACTURER_ID)
+        if not mfr_data or mfr_data[0] != _INSTANT_READOUT_PREFIX:
+            return
+
         local_name = service_info.name
-        address = service_info.address
-        self.set_device_name(local_name)
-        self.set_device_manufacturer("Victron")
-
-        self.set_precision(2)
-
-        for mfr_id, mfr_data in manufacturer_data.items():
-            if mfr_id != 0x02E1 or not mfr_data.startswith(b"\x10"):
-                continue
-            self._process_mfr_data(address, local_name, mfr_id, mfr_data, service_uuids)
-
-    def _process_mfr_data(
-        self,
-        address: str,
-        local_name: str,
-        mfr_id: int,
-        data: bytes,
-        service_uuids: list[str],
-    ) -> None:
+        if not self._device_initialized:
+            self.set_device_manufacturer("Victron")
+            self.set_precision(2)
+            self._device_initialized = True
+        if local_name != self._device_name:
+            self.set_device_name(local_name)
+            self._device_name = local_name
+
+        self._process_mfr_data(mfr_data)
+
+    def _process_mfr_data(self, data: bytes) -> None:
         """Parser for Victron sensors."""
-        device_parser = detect_device_type(data)
+        if data == self._last_payload:
+            # Re-broadcast of an advertisement we already handled
+            return
+        device_parser = _detect_device_type(data[:_HEADER_LENGTH])
         if not device_parser:
             _LOGGER.error("Could not identify Victron device type")
             return
-        parsed = device_parser(self.key).parse(data)
-        _LOGGER.debug(f"Handle Victron BLE advertisement data: {parsed._data}")
-        self.set_device_type(parsed.get_model_name())
-
-        if isinstance(parsed, DcEnergyMeterData):
-            self.update_predefined_sensor(
-                SensorLibrary.VOLTAGE__ELECTRIC_POTENTIAL_VOLT, parsed.get_voltage()
-            )
-            self.update_predefined_sensor(
-                SensorLibrary.CURRENT__ELECTRIC_CURRENT_AMPERE, parsed.get_current()
-            )
-        elif isinstance(parsed, BatteryMonitorData):
-            self.update_predefined_sensor(
-                SensorLibrary.VOLTAGE__ELECTRIC_POTENTIAL_VOLT, parsed.get_voltage()
-            )
-            self.update_predefined_sensor(
-                SensorLibrary.CURRENT__ELECTRIC_CURRENT_AMPERE, parsed.get_current()
-            )
-            self.update_predefined_sensor(
-                SensorLibrary.BATTERY__PERCENTAGE, parsed.get_soc()
-            )
+        parser = self._parsers.get(device_parser)
+        if parser is None:
+            parser = self._parsers[device_parser] = device_parser(self.key)
+        parsed = parser.parse(data)
+        self._last_payload = data
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Handle Victron BLE advertisement data: %s", parsed._data)
+        model_name = parsed.get_model_name()
+        if model_name != self._device_type:
+            self.set_device_type(model_name)
+            self._device_type = model_name
+
+        handler = self._HANDLERS.get(type(parsed))
+        if handler is not None:
+            handler(self, parsed)
+
+    def _update_enum_sensor(
+        self, key: str, member: Enum | None, name: str | None = None
+    ) -> None:
+        """Update an enum sensor with the lower-cased name of the member."""
+        self.update_sensor(key, None, _enum_name_lower(member), _CLASS_ENUM, name)
+
+    def _handle_dc_energy_meter(self, parsed: DcEnergyMeterData) -> None:
+        """Update sensors from DC energy meter data."""
+        self.update_predefined_sensor(_SENSOR_VOLTAGE, parsed.get_voltage())
+        self.update_predefined_sensor(_SENSOR_CURRENT, parsed.get_current())
+
+    def _handle_battery_monitor(self, parsed: BatteryMonitorData) -> None:
+        """Update sensors from battery monitor data."""
+        update_predefined_sensor = self.update_predefined_sensor
+        update_sensor = self.update_sensor
+        update_predefined_sensor(_SENSOR_VOLTAGE, parsed.get_voltage())
+        update_predefined_sensor(_SENSOR_CURRENT, parsed.get_current())
+        update_predefined_sensor(_SENSOR_BATTERY, parsed.get_soc())
+
+        update_sensor(
+            VictronSensor.TIME_REMAINING,
+            _UNIT_MINUTES,
+            parsed.get_remaining_mins(),
+            _CLASS_DURATION,
+            "Time remaining",
+        )
 
-            self.update_sensor(
-                key=VictronSensor.TIME_REMAINING,
-                name="Time remaining",
-                native_unit_of_measurement=Units.TIME_MINUTES,
-                native_value=parsed.get_remaining_mins(),
-                device_class=SensorDeviceClass.DURATION,
-            )
+        aux_mode = parsed.get_aux_mode()
+        if aux_mode is not self._last_aux_mode:
+            self._update_enum_sensor(
+                VictronSensor.AUX_MODE, aux_mode, "Auxilliary Input Mode"
+            )
+            self._last_aux_mode = aux_mode
+        aux_handler = self._AUX_HANDLERS.get(aux_mode)
+        if aux_handler is not None:
+            aux_handler(self, parsed)
+
+    def _handle_midpoint_voltage(self, parsed: BatteryMonitorData) -> None:
+        """Update the midpoint voltage sensor of a battery monitor."""
+        self.update_sensor(
+            VictronSensor.MIDPOINT_VOLTAGE,
+            _UNIT_VOLT,
+            parsed.get_midpoint_voltage(),
+            _CLASS_VOLTAGE,
+        )
 
-            aux_mode = parsed.get_aux_mode()
-            self.update_sensor(
-                key=VictronSensor.AUX_MODE,
-                name="Auxilliary Input Mode",
-                native_unit_of_measurement=None,
-                native_value=aux_mode.name.lower(),
-                device_class=SensorDeviceClass.ENUM,
-            )
-            if aux_mode == AuxMode.MIDPOINT_VOLTAGE:
-                self.update_sensor(
-                    key=VictronSensor.MIDPOINT_VOLTAGE,
-                    native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-                    native_value=parsed.get_midpoint_voltage(),
-                    device_class=SensorDeviceClass.VOLTAGE,
-                )
-            elif aux_mode == AuxMode.STARTER_VOLTAGE:
-                self.update_sensor(
-                    key=VictronSensor.STARTER_BATTERY_VOLTAGE,
-                    native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-                    native_value=parsed.get_starter_voltage(),
-                    device_class=SensorDeviceClass.VOLTAGE,
-                )
-            elif aux_mode == AuxMode.TEMPERATURE:
-                self.update_predefined_sensor(
-                    SensorLibrary.TEMPERATURE__CELSIUS, parsed.get_temperature()
-                )
-
-        elif isinstance(parsed, BatterySenseData):
-            self.update_predefined_sensor(
-                SensorLibrary.TEMPERATURE__CELSIUS, parsed.get_temperature()
-            )
-            self.update_predefined_sensor(
-                SensorLibrary.VOLTAGE__ELECTRIC_POTENTIAL_VOLT, parsed.get_voltage()
-            )
-        elif isinstance(parsed, SolarChargerData):
-            self.update_predefined_sensor(
-                SensorLibrary.POWER__POWER_WATT, parsed.get_solar_power()
-            )
-            self.update_predefined_sensor(
-                SensorLibrary.VOLTAGE__ELECTRIC_POTENTIAL_VOLT,
-                parsed.get_battery_voltage(),
-            )
-            self.update_predefined_sensor(
-                SensorLibrary.CURRENT__ELECTRIC_CURRENT_AMPERE,
-                parsed.get_battery_charging_current(),
-            )
-            self.update_sensor(
-                key=VictronSensor.YIELD_TODAY,
-                native_unit_of_measurement=Units.ENERGY_WATT_HOUR,
-                native_value=parsed.get_yield_today(),
-                device_class=SensorDeviceClass.CURRENT,
-            )
-            self.update_sensor(
-                key=VictronSensor.OPERATION_MODE,
-                native_unit_of_measurement=None,
-                native_value=parsed.get_charge_state().name.lower(),
-                device_class=SensorDeviceClass.ENUM,
-            )
-            if parsed.get_external_device_load():
-                self.update_sensor(
-                    key=VictronSensor.EXTERNAL_DEVICE_LOAD,
-                    native_unit_of_measurement=Units.ELECTRIC_CURRENT_AMPERE,
-                    native_value=parsed.get_external_device_load(),
-                    device_class=SensorDeviceClass.CURRENT,
-                )
-
-        elif isinstance(parsed, DcDcConverterData):
-            self.update_sensor(
-                key=VictronSensor.OPERATION_MODE,
-                native_unit_of_measurement=None,
-                native_value=parsed.get_charge_state().name.lower(),
-                device_class=SensorDeviceClass.ENUM,
-            )
-            self.update_sensor(
-                key=VictronSensor.INPUT_VOLTAGE,
-                native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-                native_value=parsed.get_input_voltage(),
-                device_class=SensorDeviceClass.VOLTAGE,
-            )
-            self.update_sensor(
-                key=VictronSensor.OUTPUT_VOLTAGE,
-                native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-                native_value=parsed.get_output_voltage(),
-                device_class=SensorDeviceClass.VOLTAGE,
-            )
-            self.update_sensor(
-                key=VictronSensor.OFF_REASON,
-                native_unit_of_measurement=None,
-                native_value=parsed.get_off_reason().name.lower(),
-                device_class=SensorDeviceClass.ENUM,
-            )
-            self.update_sensor(
-                key=VictronSensor.CHARGER_ERROR,
-                native_unit_of_measurement=None,
-                native_value=parsed.get_charger_error().name.lower(),
-                device_class=SensorDeviceClass.ENUM,
-            )
+    def _handle_starter_voltage(self, parsed: BatteryMonitorData) -> None:
+        """Update the starter battery voltage sensor of a battery monitor."""
+        self.update_sensor(
+            VictronSensor.STARTER_BATTERY_VOLTAGE,
+            _UNIT_VOLT,
+            parsed.get_starter_voltage(),
+            _CLASS_VOLTAGE,
+        )
 
-        return
+    def _handle_aux_temperature(self, parsed: BatteryMonitorData) -> None:
+        """Update the temperature sensor of a battery monitor."""
+        self.update_predefined_sensor(_SENSOR_TEMPERATURE, parsed.get_temperature())
+
+    def _handle_battery_sense(self, parsed: BatterySenseData) -> None:
+        """Update sensors from Smart Battery Sense data."""
+        self.update_predefined_sensor(_SENSOR_TEMPERATURE, parsed.get_temperature())
+        self.update_predefined_sensor(_SENSOR_VOLTAGE, parsed.get_voltage())
+
+    def _handle_solar_charger(self, parsed: SolarChargerData) -> None:
+        """Update sensors from solar charger data."""
+        update_predefined_sensor = self.update_predefined_sensor
+        update_sensor = self.update_sensor
+        update_predefined_sensor(_SENSOR_POWER, parsed.get_solar_power())
+        update_predefined_sensor(_SENSOR_VOLTAGE, parsed.get_battery_voltage())
+        update_predefined_sensor(_SENSOR_CURRENT, parsed.get_battery_charging_current())
+        update_sensor(
+            VictronSensor.YIELD_TODAY,
+            _UNIT_WATT_HOUR,
+            parsed.get_yield_today(),
+            _CLASS_CURRENT,
+        )
+        self._update_enum_sensor(
+            VictronSensor.OPERATION_MODE, parsed.get_charge_state()
+        )
+        external_device_load = parsed.get_external_device_load()
+        if external_device_load:
+            update_sensor(
+                VictronSensor.EXTERNAL_DEVICE_LOAD,
+                _UNIT_AMPERE,
+                external_device_load,
+                _CLASS_CURRENT,
+            )
+
+    def _handle_dcdc_converter(self, parsed: DcDcConverterData) -> None:
+        """Update sensors from DC-DC converter data."""
+        update_sensor = self.update_sensor
+        update_enum_sensor = self._update_enum_sensor
+        update_enum_sensor(VictronSensor.OPERATION_MODE, parsed.get_charge_state())
+        update_sensor(
+            VictronSensor.INPUT_VOLTAGE,
+            _UNIT_VOLT,
+            parsed.get_input_voltage(),
+            _CLASS_VOLTAGE,
+        )
+        update_sensor(
+            VictronSensor.OUTPUT_VOLTAGE,
+            _UNIT_VOLT,
+            parsed.get_output_voltage(),
+            _CLASS_VOLTAGE,
+        )
+        update_enum_sensor(VictronSensor.OFF_REASON, parsed.get_off_reason())
+        update_enum_sensor(VictronSensor.CHARGER_ERROR, parsed.get_charger_error())
+
+    _AUX_HANDLERS: dict[AuxMode, Callable[..., None]] = {
+        AuxMode.MIDPOINT_VOLTAGE: _handle_midpoint_voltage,
+        AuxMode.STARTER_VOLTAGE: _handle_starter_voltage,
+        AuxMode.TEMPERATURE: _handle_aux_temperature,
+    }
+
+    _HANDLERS: dict[type[DeviceData], Callable[..., None]] = {
+        DcEnergyMeterData: _handle_dc_energy_meter,
+        BatteryMonitorData: _handle_battery_monitor,
+        BatterySenseData: _handle_battery_sense,
+        SolarChargerData: _handle_solar_charger,
+        DcDcConverterData: _handle_dcdc_converter,
+    }
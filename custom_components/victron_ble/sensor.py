@@ -1,8 +1,10 @@
 """Support for Victron ble sensors."""
 from __future__ import annotations
 
-import logging
-from typing import Any, Dict, Optional, Tuple, Union
+from dataclasses import replace
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Union
 
 from bluetooth_sensor_state_data import SIGNAL_STRENGTH_KEY
 from homeassistant import config_entries
@@ -30,167 +32,140 @@ from victron_ble.devices.battery_monitor import AuxMode
 from .const import DOMAIN
 from .device import VictronSensor
 
-_LOGGER = logging.getLogger(__name__)
 
+def _enum_options(enum: type[Enum]) -> list[str]:
+    """Return the states an enum sensor reports, as set by the device parser."""
+    return [name.lower() for name in enum._member_names_]
 
-SENSOR_DESCRIPTIONS: Dict[Tuple[SensorDeviceClass, Optional[Units]], Any] = {
-    (SensorDeviceClass.TEMPERATURE, Units.TEMP_CELSIUS): SensorEntityDescription(
+
+_VOLTAGE_DESCRIPTION = SensorEntityDescription(
+    key=f"{SensorDeviceClass.VOLTAGE}_{Units.ELECTRIC_POTENTIAL_VOLT}",
+    device_class=SensorDeviceClass.VOLTAGE,
+    native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
+    state_class=SensorStateClass.MEASUREMENT,
+)
+
+_SENSOR_DESCRIPTIONS: Dict[str, SensorEntityDescription] = {
+    SensorDeviceClass.TEMPERATURE: SensorEntityDescription(
         key=f"{SensorDeviceClass.TEMPERATURE}_{Units.TEMP_CELSIUS}",
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=Units.TEMP_CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    (SensorDeviceClass.VOLTAGE, Units.ELECTRIC_POTENTIAL_VOLT): SensorEntityDescription(
-        key=f"{SensorDeviceClass.VOLTAGE}_{Units.ELECTRIC_POTENTIAL_VOLT}",
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    (SensorDeviceClass.CURRENT, Units.ELECTRIC_CURRENT_AMPERE): SensorEntityDescription(
+    SensorDeviceClass.VOLTAGE: _VOLTAGE_DESCRIPTION,
+    SensorDeviceClass.CURRENT: SensorEntityDescription(
         key=f"{SensorDeviceClass.CURRENT}_{Units.ELECTRIC_CURRENT_AMPERE}",
         device_class=SensorDeviceClass.CURRENT,
         native_unit_of_measurement=Units.ELECTRIC_CURRENT_AMPERE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    (SensorDeviceClass.BATTERY, Units.PERCENTAGE): SensorEntityDescription(
+    SensorDeviceClass.BATTERY: SensorEntityDescription(
         key=f"{SensorDeviceClass.BATTERY}_{Units.PERCENTAGE}",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=Units.PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    (VictronSensor.YIELD_TODAY, Units.ENERGY_WATT_HOUR): SensorEntityDescription(
+    VictronSensor.YIELD_TODAY: SensorEntityDescription(
         key=VictronSensor.YIELD_TODAY,
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=Units.ENERGY_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
-    (SensorDeviceClass.POWER, Units.POWER_WATT): SensorEntityDescription(
+    SensorDeviceClass.POWER: SensorEntityDescription(
         key=f"{SensorDeviceClass.POWER}_{Units.POWER_WATT}",
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=Units.POWER_WATT,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    (VictronSensor.AUX_MODE, None): SensorEntityDescription(
+    VictronSensor.AUX_MODE: SensorEntityDescription(
         key=VictronSensor.AUX_MODE,
         device_class=SensorDeviceClass.ENUM,
-        options=[x.lower() for x in AuxMode._member_names_],
+        options=_enum_options(AuxMode),
     ),
-    (VictronSensor.OPERATION_MODE, None): SensorEntityDescription(
+    VictronSensor.OPERATION_MODE: SensorEntityDescription(
         key=VictronSensor.OPERATION_MODE,
         device_class=SensorDeviceClass.ENUM,
-        options=[x.lower() for x in OperationMode._member_names_],
+        options=_enum_options(OperationMode),
     ),
-    (VictronSensor.OFF_REASON, None): SensorEntityDescription(
+    VictronSensor.OFF_REASON: SensorEntityDescription(
         key=VictronSensor.OFF_REASON,
         device_class=SensorDeviceClass.ENUM,
-        options=[x.lower() for x in OffReason._member_names_],
+        options=_enum_options(OffReason),
     ),
-    (VictronSensor.CHARGER_ERROR, None): SensorEntityDescription(
+    VictronSensor.CHARGER_ERROR: SensorEntityDescription(
         key=VictronSensor.CHARGER_ERROR,
         device_class=SensorDeviceClass.ENUM,
-        options=[x.lower() for x in ChargerError._member_names_],
+        options=_enum_options(ChargerError),
     ),
-    (VictronSensor.EXTERNAL_DEVICE_LOAD, None): SensorEntityDescription(
+    VictronSensor.EXTERNAL_DEVICE_LOAD: SensorEntityDescription(
         key=VictronSensor.EXTERNAL_DEVICE_LOAD,
         device_class=SensorDeviceClass.CURRENT,
         native_unit_of_measurement=Units.ELECTRIC_CURRENT_AMPERE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    (VictronSensor.TIME_REMAINING, Units.TIME_MINUTES): SensorEntityDescription(
+    VictronSensor.TIME_REMAINING: SensorEntityDescription(
         key=VictronSensor.TIME_REMAINING,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=Units.TIME_MINUTES,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    (
-        VictronSensor.INPUT_VOLTAGE,
-        Units.ELECTRIC_POTENTIAL_VOLT,
-    ): SensorEntityDescription(
-        key=VictronSensor.INPUT_VOLTAGE,
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    (
-        VictronSensor.OUTPUT_VOLTAGE,
-        Units.ELECTRIC_POTENTIAL_VOLT,
-    ): SensorEntityDescription(
-        key=VictronSensor.OUTPUT_VOLTAGE,
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
+    VictronSensor.INPUT_VOLTAGE: replace(
+        _VOLTAGE_DESCRIPTION, key=VictronSensor.INPUT_VOLTAGE
     ),
-    (SensorDeviceClass.BATTERY, Units.PERCENTAGE): SensorEntityDescription(
-        key=f"{SensorDeviceClass.BATTERY}_{Units.PERCENTAGE}",
-        device_class=SensorDeviceClass.BATTERY,
-        native_unit_of_measurement=Units.PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
+    VictronSensor.OUTPUT_VOLTAGE: replace(
+        _VOLTAGE_DESCRIPTION, key=VictronSensor.OUTPUT_VOLTAGE
     ),
-    (
-        SIGNAL_STRENGTH_KEY,
-        Units.SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-    ): SensorEntityDescription(
+    SIGNAL_STRENGTH_KEY: SensorEntityDescription(
         key=f"{SensorDeviceClass.SIGNAL_STRENGTH}_{Units.SIGNAL_STRENGTH_DECIBELS_MILLIWATT}",
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         native_unit_of_measurement=Units.SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    (
-        VictronSensor.STARTER_BATTERY_VOLTAGE,
-        Units.ELECTRIC_POTENTIAL_VOLT,
-    ): SensorEntityDescription(
-        key=VictronSensor.STARTER_BATTERY_VOLTAGE,
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
+    VictronSensor.STARTER_BATTERY_VOLTAGE: replace(
+        _VOLTAGE_DESCRIPTION, key=VictronSensor.STARTER_BATTERY_VOLTAGE
     ),
-    (
-        VictronSensor.MIDPOINT_VOLTAGE,
-        Units.ELECTRIC_POTENTIAL_VOLT,
-    ): SensorEntityDescription(
-        key=VictronSensor.MIDPOINT_VOLTAGE,
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=Units.ELECTRIC_POTENTIAL_VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
+    VictronSensor.MIDPOINT_VOLTAGE: replace(
+        _VOLTAGE_DESCRIPTION, key=VictronSensor.MIDPOINT_VOLTAGE
     ),
 }
 
+SENSOR_DESCRIPTIONS: Mapping[str, SensorEntityDescription] = MappingProxyType(
+    _SENSOR_DESCRIPTIONS
+)
+
 
 def sensor_update_to_bluetooth_data_update(
     sensor_update: SensorUpdate,
 ) -> PassiveBluetoothDataUpdate:
     """Convert a sensor update to a bluetooth data update."""
-    data = PassiveBluetoothDataUpdate(
+    entity_key_cls = PassiveBluetoothEntityKey
+    descriptions = _SENSOR_DESCRIPTIONS
+
+    entity_descriptions: dict[PassiveBluetoothEntityKey, SensorEntityDescription] = {}
+    for device_key, description in sensor_update.entity_descriptions.items():
+        if description.device_key:
+            entity_descriptions[
+                entity_key_cls(device_key.key, device_key.device_id)
+            ] = descriptions[description.device_key.key]
+
+    # Values and names share their keys, so build both in a single pass
+    entity_data: dict[PassiveBluetoothEntityKey, Optional[Union[float, int]]] = {}
+    entity_names: dict[PassiveBluetoothEntityKey, Optional[str]] = {}
+    for device_key, sensor_values in sensor_update.entity_values.items():
+        entity_key = entity_key_cls(device_key.key, device_key.device_id)
+        entity_data[entity_key] = sensor_values.native_value
+        entity_names[entity_key] = sensor_values.name
+
+    return PassiveBluetoothDataUpdate(
         devices={
             device_id: sensor_device_info_to_hass_device_info(device_info)
             for device_id, device_info in sensor_update.devices.items()
         },
-        entity_descriptions={
-            PassiveBluetoothEntityKey(
-                device_key.key, device_key.device_id
-            ): SENSOR_DESCRIPTIONS[
-                (description.device_key.key, description.native_unit_of_measurement)
-            ]
-            for device_key, description in sensor_update.entity_descriptions.items()
-            if description.device_key
-        },
-        entity_data={
-            PassiveBluetoothEntityKey(
-                device_key.key, device_key.device_id
-            ): sensor_values.native_value
-            for device_key, sensor_values in sensor_update.entity_values.items()
-        },
-        entity_names={
-            PassiveBluetoothEntityKey(
-                device_key.key, device_key.device_id
-            ): sensor_values.name
-            for device_key, sensor_values in sensor_update.entity_values.items()
-        },
+        entity_descriptions=entity_descriptions,
+        entity_data=entity_data,
+        entity_names=entity_names,
     )
-    _LOGGER.debug(f"IN 2here: {data}")
-
-    return data
 
 
 async def async_setup_entry(
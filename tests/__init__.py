@@ -1 +1,78 @@
 """Tests for the victron_ble integration."""
+import struct
+
+from Crypto.Cipher import AES
+from Crypto.Util import Counter
+from home_assistant_bluetooth import BluetoothServiceInfo
+
+ADVERTISEMENT_KEY = "adeccb947395801a4dd45a2eaa44bf17"
+
+SOLAR_CHARGER_MODEL_ID = 0xA060
+DCDC_CONVERTER_MODEL_ID = 0xA3C0
+
+SOLAR_CHARGER_READOUT = 0x01
+DCDC_CONVERTER_READOUT = 0x04
+
+
+def make_advertisement(
+    model_id: int, readout_type: int, payload: bytes, iv: int = 0x1234
+) -> bytes:
+    """Encrypt a readout payload into Victron Instant Readout manufacturer data."""
+    key = bytes.fromhex(ADVERTISEMENT_KEY)
+    counter = Counter.new(128, initial_value=iv, little_endian=True)
+    cipher = AES.new(key, AES.MODE_CTR, counter=counter)
+    header = struct.pack("<HHBH", 0x0210, model_id, readout_type, iv)
+    return header + key[:1] + cipher.encrypt(payload)
+
+
+def solar_charger_payload(
+    charge_state: int = 3,
+    charger_error: int = 0,
+    battery_voltage: int = 1340,
+    battery_charging_current: int = 52,
+    yield_today: int = 12,
+    solar_power: int = 75,
+    external_device_load: int = 15,
+) -> bytes:
+    """Pack a solar charger readout, in the raw units the device sends."""
+    return struct.pack(
+        "<BBhhHHH",
+        charge_state,
+        charger_error,
+        battery_voltage,
+        battery_charging_current,
+        yield_today,
+        solar_power,
+        external_device_load,
+    )
+
+
+def dcdc_converter_payload(
+    device_state: int = 3,
+    charger_error: int = 0,
+    input_voltage: int = 1410,
+    output_voltage: int = 1360,
+    off_reason: int = 0,
+) -> bytes:
+    """Pack a DC-DC converter readout, in the raw units the device sends."""
+    return struct.pack(
+        "<BBHhI",
+        device_state,
+        charger_error,
+        input_voltage,
+        output_voltage,
+        off_reason,
+    )
+
+
+def make_service_info(manufacturer_data: bytes) -> BluetoothServiceInfo:
+    """Wrap Victron manufacturer data in a service info."""
+    return BluetoothServiceInfo(
+        name="Victron Device",
+        address="AA:BB:CC:DD:EE:FF",
+        rssi=-60,
+        manufacturer_data={0x02E1: manufacturer_data},
+        service_data={},
+        service_uuids=[],
+        source="local",
+    )
@@ -0,0 +1,146 @@
+"""Test the victron_ble advertisement parser."""
+from unittest.mock import patch
+
+from sensor_state_data import DeviceKey
+from victron_ble.devices.solar_charger import SolarCharger
+
+from custom_components.victron_ble.device import VictronBluetoothDeviceData
+
+from . import (
+    ADVERTISEMENT_KEY,
+    DCDC_CONVERTER_MODEL_ID,
+    DCDC_CONVERTER_READOUT,
+    SOLAR_CHARGER_MODEL_ID,
+    SOLAR_CHARGER_READOUT,
+    dcdc_converter_payload,
+    make_advertisement,
+    make_service_info,
+    solar_charger_payload,
+)
+
+
+def _values(update) -> dict:
+    return {
+        device_key.key: value.native_value
+        for device_key, value in update.entity_values.items()
+    }
+
+
+def test_solar_charger() -> None:
+    """Test a solar charger advertisement."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    update = data.update(
+        make_service_info(
+            make_advertisement(
+                SOLAR_CHARGER_MODEL_ID, SOLAR_CHARGER_READOUT, solar_charger_payload()
+            )
+        )
+    )
+
+    assert update.devices[None].name == "Victron Device"
+    assert update.devices[None].model == "SmartSolar MPPT 100|20 48V"
+    assert _values(update) == {
+        "power": 75,
+        "voltage": 13.4,
+        "current": 5.2,
+        "yield_today": 120,
+        "operation_mode": "bulk",
+        "external_device_load": 1.5,
+        "signal_strength": -60,
+    }
+    assert (
+        update.entity_descriptions[
+            DeviceKey("external_device_load")
+        ].native_unit_of_measurement
+        == "A"
+    )
+
+
+def test_solar_charger_unknown_charge_state() -> None:
+    """Test a solar charger reporting an unknown charge state."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    update = data.update(
+        make_service_info(
+            make_advertisement(
+                SOLAR_CHARGER_MODEL_ID,
+                SOLAR_CHARGER_READOUT,
+                solar_charger_payload(charge_state=0xFF),
+            )
+        )
+    )
+
+    assert _values(update)["operation_mode"] is None
+
+
+def test_dcdc_converter() -> None:
+    """Test a DC-DC converter advertisement."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    update = data.update(
+        make_service_info(
+            make_advertisement(
+                DCDC_CONVERTER_MODEL_ID,
+                DCDC_CONVERTER_READOUT,
+                dcdc_converter_payload(),
+            )
+        )
+    )
+
+    assert _values(update) == {
+        "operation_mode": "bulk",
+        "input_voltage": 14.1,
+        "output_voltage": 13.6,
+        "off_reason": "no_reason",
+        "charger_error": "no_error",
+        "signal_strength": -60,
+    }
+
+
+def test_dcdc_converter_unknown_states() -> None:
+    """Test a DC-DC converter reporting unknown state and error."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    update = data.update(
+        make_service_info(
+            make_advertisement(
+                DCDC_CONVERTER_MODEL_ID,
+                DCDC_CONVERTER_READOUT,
+                dcdc_converter_payload(device_state=0xFF, charger_error=0xFF),
+            )
+        )
+    )
+
+    values = _values(update)
+    assert values["operation_mode"] is None
+    assert values["charger_error"] is None
+
+
+def test_repeated_advertisement_is_not_parsed() -> None:
+    """Test a re-broadcast payload is skipped but keeps the last values."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    service_info = make_service_info(
+        make_advertisement(
+            SOLAR_CHARGER_MODEL_ID, SOLAR_CHARGER_READOUT, solar_charger_payload()
+        )
+    )
+
+    with patch.object(
+        SolarCharger, "parse", autospec=True, side_effect=SolarCharger.parse
+    ) as mock_parse:
+        first = _values(data.update(service_info))
+        second = _values(data.update(service_info))
+        assert mock_parse.call_count == 1
+
+        changed = _values(
+            data.update(
+                make_service_info(
+                    make_advertisement(
+                        SOLAR_CHARGER_MODEL_ID,
+                        SOLAR_CHARGER_READOUT,
+                        solar_charger_payload(solar_power=80),
+                    )
+                )
+            )
+        )
+        assert mock_parse.call_count == 2
+
+    assert second == first
+    assert changed["power"] == 80
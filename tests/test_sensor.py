@@ -0,0 +1,75 @@
+"""Test the victron_ble sensor update conversion."""
+from homeassistant.components.bluetooth.passive_update_processor import (
+    PassiveBluetoothEntityKey,
+)
+
+from custom_components.victron_ble.device import VictronBluetoothDeviceData
+from custom_components.victron_ble.sensor import (
+    SENSOR_DESCRIPTIONS,
+    sensor_update_to_bluetooth_data_update,
+)
+
+from . import (
+    ADVERTISEMENT_KEY,
+    DCDC_CONVERTER_MODEL_ID,
+    DCDC_CONVERTER_READOUT,
+    SOLAR_CHARGER_MODEL_ID,
+    SOLAR_CHARGER_READOUT,
+    dcdc_converter_payload,
+    make_advertisement,
+    make_service_info,
+    solar_charger_payload,
+)
+
+
+def test_solar_charger_update() -> None:
+    """Test converting a solar charger update."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    update = sensor_update_to_bluetooth_data_update(
+        data.update(
+            make_service_info(
+                make_advertisement(
+                    SOLAR_CHARGER_MODEL_ID,
+                    SOLAR_CHARGER_READOUT,
+                    solar_charger_payload(),
+                )
+            )
+        )
+    )
+
+    load_key = PassiveBluetoothEntityKey("external_device_load", None)
+    assert (
+        update.entity_descriptions[load_key]
+        is SENSOR_DESCRIPTIONS["external_device_load"]
+    )
+    assert update.entity_data == {
+        PassiveBluetoothEntityKey("power", None): 75,
+        PassiveBluetoothEntityKey("voltage", None): 13.4,
+        PassiveBluetoothEntityKey("current", None): 5.2,
+        PassiveBluetoothEntityKey("yield_today", None): 120,
+        PassiveBluetoothEntityKey("operation_mode", None): "bulk",
+        load_key: 1.5,
+        PassiveBluetoothEntityKey("signal_strength", None): -60,
+    }
+    assert set(update.entity_names) == set(update.entity_data)
+
+
+def test_dcdc_converter_unknown_states_update() -> None:
+    """Test converting a DC-DC converter update with unknown enum states."""
+    data = VictronBluetoothDeviceData(ADVERTISEMENT_KEY)
+    update = sensor_update_to_bluetooth_data_update(
+        data.update(
+            make_service_info(
+                make_advertisement(
+                    DCDC_CONVERTER_MODEL_ID,
+                    DCDC_CONVERTER_READOUT,
+                    dcdc_converter_payload(device_state=0xFF, charger_error=0xFF),
+                )
+            )
+        )
+    )
+
+    for key in ("operation_mode", "charger_error"):
+        entity_key = PassiveBluetoothEntityKey(key, None)
+        assert update.entity_data[entity_key] is None
+        assert update.entity_descriptions[entity_key] is SENSOR_DESCRIPTIONS[key]